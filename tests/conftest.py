@@ -0,0 +1,120 @@
+"""Shared fixtures for the crepr tests."""
+
+import hashlib
+import importlib.util
+import pathlib
+import shutil
+import sys
+import uuid
+from collections.abc import Callable
+from collections.abc import Sequence
+from types import ModuleType
+
+import pytest
+from typer.testing import CliRunner
+from typer.testing import Result
+
+from crepr import crepr
+
+KW_ONLY_FILE = "tests/classes/kw_only_test.py"
+CLASS_FILES = (
+    KW_ONLY_FILE,
+    "tests/classes/class_no_init_test.py",
+    "tests/classes/dataclass_test.py",
+    "tests/classes/splat_kwargs_test.py",
+)
+
+
+def load_module(file_path: pathlib.Path) -> ModuleType:
+    """Import a python source file under a unique module name."""
+    spec = importlib.util.spec_from_file_location(uuid.uuid4().hex, file_path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def module_cache() -> dict[tuple[str, str], ModuleType]:
+    """Cache the loaded test modules for the whole session."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def classes_module(
+    module_cache: dict[tuple[str, str], ModuleType],
+) -> Callable[[str], ModuleType]:
+    """Return a loader that imports each version of a test module only once."""
+
+    def _load(file_name: str) -> ModuleType:
+        file_path = pathlib.Path(file_name)
+        key = (file_name, hashlib.sha256(file_path.read_bytes()).hexdigest())
+        if key not in module_cache:
+            module_cache[key] = load_module(file_path)
+        return module_cache[key]
+
+    return _load
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preimport(classes_module: Callable[[str], ModuleType]) -> None:
+    """Import the test class modules once at the start of the session."""
+    for file_name in CLASS_FILES:
+        classes_module(file_name)
+
+
+@pytest.fixture
+def kw_only_module(classes_module: Callable[[str], ModuleType]) -> ModuleType:
+    """Return the kw only test module."""
+    return classes_module(KW_ONLY_FILE)
+
+
+@pytest.fixture
+def copy_to_tmp(tmp_path: pathlib.Path) -> Callable[[str], pathlib.Path]:
+    """Return a function that copies a test source file into ``tmp_path``.
+
+    ``shutil.copyfile`` copies in the kernel with ``os.sendfile`` on Linux
+    and falls back to a buffered copy elsewhere.
+    """
+
+    def _copy(file_name: str) -> pathlib.Path:
+        target = tmp_path / pathlib.Path(file_name).name
+        shutil.copyfile(file_name, target)
+        return target
+
+    return _copy
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Share one CliRunner between all tests."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_app(runner: CliRunner) -> None:
+    """Run the app once so its lazy imports are not charged to the first test."""
+    runner.invoke(crepr.app, ["--help"])
+
+
+@pytest.fixture(scope="session")
+def invoke_cached(runner: CliRunner) -> Callable[[Sequence[str]], Result]:
+    """Invoke the app once per argument list and reuse the result.
+
+    Only use this for invocations that do not modify any files.
+    """
+    cache: dict[tuple[str, ...], Result] = {}
+
+    def _invoke(args: Sequence[str]) -> Result:
+        key = tuple(args)
+        if key not in cache:
+            cache[key] = runner.invoke(
+                crepr.app,
+                list(args),
+                catch_exceptions=False,
+            )
+        return cache[key]
+
+    return _invoke